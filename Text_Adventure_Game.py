@@ -1,17 +1,46 @@
 #!/usr/bin/env python3
 """
 Simple Text-Based Adventure Game
-Save as adventure.py and run: python adventure.py
+Run: python Text_Adventure_Game.py
+Pure Python with no C extensions, so it also runs under PyPy: pypy3 Text_Adventure_Game.py
 """
 
 import random
 import sys
+from collections import deque
+from enum import Enum
+from itertools import chain
+
+# The only legal exit directions, mapped to their interned constant so one dict probe both
+# validates a direction and canonicalises it (exit lookups then short-circuit on identity)
+_DIRECTIONS = {d: sys.intern(d) for d in ("north", "south", "east", "west", "up", "down")}
+
+
+def _squash_spaces(text: str) -> str:
+    # "small  potion" -> "small potion"; only used after an exact-name lookup misses
+    return " ".join(text.split())
+
+
+_HELP_TEXT = (
+    "Commands:\n"
+    "  go <direction>      Move to a room (north, south, east, west, up, down).\n"
+    "  look                Show the current room description again.\n"
+    "  take <item>         Pick up an item.\n"
+    "  inventory           Show your items and stats.\n"
+    "  use <item>          Use an item from inventory (e.g. potion).\n"
+    "  fight <enemy>       Engage an enemy in the room.\n"
+    "  help                Show this help text.\n"
+    "  quit                Quit the game."
+)
+_FIGHT_PROMPT = "Type 'c' to continue fighting, 'use <item>' to use an item, or 'flee' to run: "
 
 # -------------------------
 # Game object definitions
 # -------------------------
 
 class Item:
+    __slots__ = ("name", "description", "heal", "attack_bonus")
+
     def __init__(self, name: str, description: str, heal: int = 0, attack_bonus: int = 0):
         self.name = name.lower()
         self.description = description
@@ -28,6 +57,8 @@ class Item:
 
 
 class Enemy:
+    __slots__ = ("name", "hp", "attack", "description")
+
     def __init__(self, name: str, hp: int, attack: int, description: str = ""):
         self.name = name.lower()
         self.hp = hp
@@ -46,65 +77,125 @@ class Enemy:
 
 
 class Room:
+    __slots__ = ("name", "description", "items", "enemies", "exits", "_exits_str",
+                 "_header", "_desc_cache")
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
-        self.items = []         # list of Item
-        self.enemies = []       # list of Enemy
+        self.items = {}         # item name -> list of Item (duplicates allowed)
+        self.enemies = {}       # enemy name -> list of Enemy (duplicates allowed)
         self.exits = {}         # direction -> Room
+        self._exits_str = ""     # ", ".join(exits), rebuilt by connect
+        self._header = f"You are in {name}.\n{description}"
+        self._desc_cache = None  # rendered get_description(); None when stale
+
+    def invalidate_description(self):
+        # Call whenever items, enemies (including their liveness) or exits change
+        self._desc_cache = None
 
     def add_item(self, item: Item):
-        self.items.append(item)
+        self.items.setdefault(item.name, []).append(item)
+        self.invalidate_description()
+
+    def take_item(self, item_name: str):
+        # Remove and return one item with this name, or None if there is none
+        found = self.items.get(item_name)
+        if not found:
+            return None
+        item = found.pop()
+        if not found:
+            del self.items[item_name]
+        self.invalidate_description()
+        return item
 
     def add_enemy(self, enemy: Enemy):
-        self.enemies.append(enemy)
+        self.enemies.setdefault(enemy.name, []).append(enemy)
+        self.invalidate_description()
 
     def connect(self, other_room, direction: str):
         """
         Connect self to other_room. direction is from self -> other_room.
-        Allowed directions: 'north','south','east','west','up','down'
+        Allowed directions (lowercase): 'north','south','east','west','up','down'
         This convenience method does NOT auto-create the reverse connection.
         """
-        self.exits[direction.lower()] = other_room
+        canonical = _DIRECTIONS.get(direction)
+        if canonical is None:
+            raise ValueError(f"Invalid direction: {direction!r}")
+        self.exits[canonical] = other_room
+        self._exits_str = ", ".join(self.exits.keys())
+        self.invalidate_description()
 
     def get_description(self):
-        lines = [f"You are in {self.name}.", self.description]
+        if self._desc_cache is not None:
+            return self._desc_cache
+        lines = [self._header]
         if self.items:
-            lines.append("You see the following items: " + ", ".join(i.name for i in self.items))
+            lines.append("You see the following items: " + ", ".join(
+                i.name for i in chain.from_iterable(self.items.values())))
         if self.enemies:
-            alive = [e.name for e in self.enemies if e.is_alive()]
+            alive = [e.name for e in chain.from_iterable(self.enemies.values()) if e.is_alive()]
             if alive:
                 lines.append("Enemies here: " + ", ".join(alive))
         if self.exits:
-            lines.append("Exits: " + ", ".join(self.exits.keys()))
-        return "\n".join(lines)
+            lines.append("Exits: " + self._exits_str)
+        self._desc_cache = "\n".join(lines)
+        return self._desc_cache
 
 
 class Player:
+    __slots__ = ("name", "current_room", "hp", "base_attack", "inventory", "_attack_cache",
+                 "_room_history")
+
     def __init__(self, starting_room: Room, name: str = "Player"):
         self.name = name
         self.current_room = starting_room
         self.hp = 30
         self.base_attack = 5
         self.inventory = []
+        self._attack_cache = self.base_attack   # base + bonuses of carried items
+        self._room_history = deque(maxlen=8)    # previously visited rooms, most recent last
 
     def is_alive(self):
         return self.hp > 0
 
     def attack_value(self):
-        # Attack value = base + any attack bonuses from items in inventory
-        bonus = sum(i.attack_bonus for i in self.inventory)
-        return self.base_attack + bonus
+        # Attack value = base + any attack bonuses from items in inventory,
+        # kept up to date by add_item/remove_item
+        return self._attack_cache
+
+    def move_to(self, room: Room):
+        # Remember where we came from so retreat() can go back there
+        self._room_history.append(self.current_room)
+        self.current_room = room
+
+    def retreat(self):
+        # Go back to the previous room and return it, or return None if there is none
+        if not self._room_history:
+            return None
+        self.current_room = self._room_history.pop()
+        return self.current_room
 
     def add_item(self, item: Item):
         self.inventory.append(item)
+        self._attack_cache += item.attack_bonus
+
+    def remove_item(self, index: int):
+        # Swap with the last item and pop from the tail: O(1), and a bag has no order
+        inv = self.inventory
+        last = len(inv) - 1
+        inv[index], inv[last] = inv[last], inv[index]
+        used = inv.pop()
+        if used.attack_bonus:
+            self._attack_cache -= used.attack_bonus
+        return used
 
     def use_healing(self):
         # Use the first healing item in inventory automatically (for convenience)
         for i, it in enumerate(self.inventory):
             if it.heal > 0:
                 self.hp += it.heal
-                used = self.inventory.pop(i)
+                used = self.remove_item(i)
                 return used
         return None
 
@@ -115,12 +206,30 @@ class Player:
 # Game engine
 # -------------------------
 
+class CombatAction(Enum):
+    # What the player chose at the combat prompt (see Game._combat_action)
+    CONTINUE = "continue"
+    USE = "use"
+    FLEE = "flee"
+    UNKNOWN = "unknown"
+
+
 class Game:
     def __init__(self):
         self.rooms = {}
         self.player = None
         self.create_world()
         self._intro_shown = False
+        # command word -> handler(arg); keys interned so lookups hit the identity fast path
+        self._dispatch = {
+            sys.intern("help"): self._cmd_help,
+            sys.intern("look"): self._cmd_look,
+            sys.intern("inventory"): self._cmd_inventory,
+            sys.intern("go"): self._cmd_go_wrap,
+            sys.intern("take"): self._cmd_take_wrap,
+            sys.intern("fight"): self._cmd_fight_wrap,
+            sys.intern("use"): self._cmd_use_wrap,
+        }
 
     def create_world(self):
         # Create rooms
@@ -184,110 +293,126 @@ class Game:
                 print("You have perished. Game over.")
                 break
 
-            user = input("\n> ").strip()
+            try:
+                user = input("\n> ").strip()
+            except EOFError:
+                # Ctrl-D / end of piped input: leave the loop like 'quit'
+                print()
+                break
             if not user:
                 continue
-            if user.lower() in ("quit", "exit"):
+            # Input is lowercased here once; everything downstream assumes lowercase
+            user = user.lower()
+            if user in ("quit", "exit"):
                 print("Thanks for playing — goodbye!")
                 break
-            self.handle_command(user.lower())
+            self.handle_command(user)
 
     def handle_command(self, cmd_line: str):
-        parts = cmd_line.split()
-        cmd = parts[0]
-
-        if cmd == "help":
-            self.cmd_help()
-        elif cmd == "look":
-            print(self.player.current_room.get_description())
-        elif cmd == "inventory":
-            self.cmd_inventory()
-        elif cmd == "go":
-            if len(parts) < 2:
-                print("Go where? Usage: go <direction>")
-            else:
-                self.cmd_go(parts[1])
-        elif cmd == "take":
-            if len(parts) < 2:
-                print("Take what? Usage: take <item>")
-            else:
-                self.cmd_take(" ".join(parts[1:]))
-        elif cmd == "fight":
-            if len(parts) < 2:
-                print("Fight whom? Usage: fight <enemy>")
-            else:
-                self.cmd_fight(" ".join(parts[1:]))
-        elif cmd == "use":
-            # use <itemname> - currently only healing items supported
-            if len(parts) < 2:
-                print("Use what? Usage: use <itemname>")
-            else:
-                self.cmd_use(" ".join(parts[1:]))
+        # Split off the command word only; start() has already stripped the line
+        parts = cmd_line.split(None, 1)
+        handler = self._dispatch.get(parts[0])
+        if handler:
+            handler(parts[1] if len(parts) > 1 else "")
         else:
             print("Unknown command. Type 'help' for commands.")
 
+    # Dispatch wrappers: each takes the argument text after the command word and validates it
+
+    def _cmd_help(self, arg):
+        self.cmd_help()
+
+    def _cmd_look(self, arg):
+        print(self.player.current_room.get_description())
+
+    def _cmd_inventory(self, arg):
+        self.cmd_inventory()
+
+    def _cmd_go_wrap(self, arg):
+        if not arg:
+            print("Go where? Usage: go <direction>")
+        else:
+            self.cmd_go(arg)
+
+    def _cmd_take_wrap(self, arg):
+        if not arg:
+            print("Take what? Usage: take <item>")
+        else:
+            self.cmd_take(arg)
+
+    def _cmd_fight_wrap(self, arg):
+        if not arg:
+            print("Fight whom? Usage: fight <enemy>")
+        else:
+            self.cmd_fight(arg)
+
+    def _cmd_use_wrap(self, arg):
+        # use <itemname> - currently only healing items supported
+        if not arg:
+            print("Use what? Usage: use <itemname>")
+        else:
+            self.cmd_use(arg)
+
     def cmd_help(self):
-        print(
-            "Commands:\n"
-            "  go <direction>      Move to a room (north, south, east, west, up, down).\n"
-            "  look                Show the current room description again.\n"
-            "  take <item>         Pick up an item.\n"
-            "  inventory           Show your items and stats.\n"
-            "  use <item>          Use an item from inventory (e.g. potion).\n"
-            "  fight <enemy>       Engage an enemy in the room.\n"
-            "  help                Show this help text.\n"
-            "  quit                Quit the game."
-        )
+        print(_HELP_TEXT)
 
     def cmd_inventory(self):
-        print(self.player)
         if not self.player.inventory:
-            print("Inventory is empty.")
+            sys.stdout.write(f"{self.player}\nInventory is empty.\n")
         else:
-            print("Inventory:")
-            for it in self.player.inventory:
-                print(" -", it)
+            # inventory order is not kept (see Player.remove_item), so list it by name
+            items = sorted(self.player.inventory, key=lambda it: it.name)
+            lines = [str(self.player), "Inventory:", *(f" - {it}" for it in items)]
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def cmd_go(self, direction: str):
         room = self.player.current_room
-        if direction not in room.exits:
+        direction = _DIRECTIONS.get(direction)
+        if direction is None:
+            print("That's not a direction. Try north, south, east, west, up or down.")
+            return
+        new_room = room.exits.get(direction)
+        if new_room is None:
             print("You can't go that way.")
             return
-        new_room = room.exits[direction]
-        self.player.current_room = new_room
-        print(f"You go {direction} to the {new_room.name}.")
-        print(new_room.get_description())
+        self.player.move_to(new_room)
+        sys.stdout.write(f"You go {direction} to the {new_room.name}.\n{new_room.get_description()}\n")
 
     def cmd_take(self, item_name: str):
         room = self.player.current_room
-        item_name = item_name.lower()
-        for i, it in enumerate(room.items):
-            if it.name == item_name:
-                self.player.add_item(it)
-                room.items.pop(i)
-                print(f"You took the {it.name}.")
-                return
+        it = room.take_item(item_name)
+        if it:
+            self.player.add_item(it)
+            print(f"You took the {it.name}.")
+            return
+        squashed = _squash_spaces(item_name)
+        if squashed != item_name:
+            return self.cmd_take(squashed)
         print("No such item here.")
 
     def cmd_use(self, item_name: str):
-        item_name = item_name.lower()
         for i, it in enumerate(self.player.inventory):
             if it.name == item_name:
                 if it.heal > 0:
                     self.player.hp += it.heal
-                    self.player.inventory.pop(i)
+                    self.player.remove_item(i)
                     print(f"You used {it.name} and restored {it.heal} HP. Current HP: {self.player.hp}")
                 else:
                     print(f"You used {it.name}, but nothing notable happened.")
                 return
+        squashed = _squash_spaces(item_name)
+        if squashed != item_name:
+            return self.cmd_use(squashed)
         print("You don't have that item.")
 
     def find_enemy_in_room(self, enemy_name: str):
         room = self.player.current_room
-        enemy_name = enemy_name.lower()
-        for e in room.enemies:
-            if e.name == enemy_name and e.is_alive():
+        for e in room.enemies.get(enemy_name, ()):
+            if e.is_alive():
                 return e
+        squashed = _squash_spaces(enemy_name)
+        if squashed != enemy_name:
+            return self.find_enemy_in_room(squashed)
         return None
 
     def cmd_fight(self, enemy_name: str):
@@ -296,51 +421,79 @@ class Game:
             print("No such enemy here.")
             return
 
-        print(f"You engage the {enemy.name}!")
+        # Bind hot lookups to locals once; the loop below runs every combat round
+        _randint = random.randint
+        _random = random.random
+        player = self.player
+        enemy_name_str = enemy.name
+
+        # Each round's lines are collected in out and written in one go
+        out = [f"You engage the {enemy_name_str}!"]
         # Simple turn-based combat: player attacks first
-        while enemy.is_alive() and self.player.is_alive():
+        while enemy.is_alive() and player.is_alive():
             # Player attack
-            player_atk = self.player.attack_value() + random.randint(0, 3)  # small randomness
+            player_atk = player.attack_value() + _randint(0, 3)  # small randomness
             dmg_to_enemy = max(1, player_atk)
             enemy.take_damage(dmg_to_enemy)
-            print(f"You hit the {enemy.name} for {dmg_to_enemy} damage. {enemy.name} HP is now {max(0, enemy.hp)}.")
+            out.append(f"You hit the {enemy_name_str} for {dmg_to_enemy} damage. {enemy_name_str} HP is now {max(0, enemy.hp)}.")
 
             if not enemy.is_alive():
-                print(f"You defeated the {enemy.name}!")
+                out.append(f"You defeated the {enemy_name_str}!")
+                player.current_room.invalidate_description()
                 # Maybe drop item or reward (simple: chance of potion)
-                if random.random() < 0.4:
+                if _random() < 0.4:
                     loot = Item("Small Potion", "A potion dropped by the enemy.", heal=8)
-                    self.player.current_room.add_item(loot)
-                    print(f"The {enemy.name} dropped a Small Potion.")
+                    player.current_room.add_item(loot)
+                    out.append(f"The {enemy_name_str} dropped a Small Potion.")
+                sys.stdout.write("\n".join(out) + "\n")
                 return
 
             # Enemy turn
-            enemy_atk = enemy.attack + random.randint(0, 2)
+            enemy_atk = enemy.attack + _randint(0, 2)
             dmg_to_player = max(1, enemy_atk)
-            self.player.hp -= dmg_to_player
-            print(f"The {enemy.name} hits you for {dmg_to_player}. Your HP is now {max(0, self.player.hp)}.")
+            player.hp -= dmg_to_player
+            out.append(f"The {enemy_name_str} hits you for {dmg_to_player}. Your HP is now {max(0, player.hp)}.")
 
-            if not self.player.is_alive():
-                print("You were slain in battle...")
+            if not player.is_alive():
+                out.append("You were slain in battle...")
+                sys.stdout.write("\n".join(out) + "\n")
                 return
 
+            sys.stdout.write("\n".join(out) + "\n")
+            out.clear()
+
             # Prompt: allow player to choose to continue or use item
-            action = input("Type 'c' to continue fighting, 'use <item>' to use an item, or 'flee' to run: ").strip().lower()
-            if action == "flee":
-                # attempt to flee back to previous room if possible; set to foyer for simplicity
-                # For a slightly better approach, we could track previous room; here we send to foyer.
-                self.player.current_room = self.rooms.get("foyer", self.player.current_room)
-                print("You flee back to the foyer to safety.")
-                print(self.player.current_room.get_description())
+            action, arg = self._combat_action()
+            if action is CombatAction.FLEE:
+                # flee back to the room we came from; fall back to the foyer if there is none
+                room = player.retreat()
+                if room is None:
+                    room = player.current_room = self.rooms.get("foyer", player.current_room)
+                sys.stdout.write(f"You flee back to the {room.name} to safety.\n{room.get_description()}\n")
                 return
-            elif action.startswith("use "):
-                self.handle_command(action)
+            elif action is CombatAction.USE:
+                self.cmd_use(arg)
                 # continue loop; enemy may attack again in next iteration
-            elif action == "c" or action == "":
-                continue
-            else:
+            elif action is CombatAction.UNKNOWN:
                 print("Unknown option; continuing the fight.")
 
+    def _combat_action(self):
+        # Read one combat choice; returns (CombatAction, item name for USE or "")
+        try:
+            action = input(_FIGHT_PROMPT).strip().lower()
+        except EOFError:
+            # no more input; get out of the fight so start() can end the game
+            print()
+            return CombatAction.FLEE, ""
+        if action == "c" or action == "":
+            return CombatAction.CONTINUE, ""
+        if action == "flee":
+            return CombatAction.FLEE, ""
+        parts = action.split(None, 1)
+        if len(parts) == 2 and parts[0] == "use":
+            return CombatAction.USE, parts[1]
+        return CombatAction.UNKNOWN, ""
+
 # -------------------------
 # Entry point
 # -------------------------
@@ -351,7 +504,6 @@ def main():
         game.start()
     except KeyboardInterrupt:
         print("\nGoodbye!")
-        sys.exit(0)
 
 if __name__ == "__main__":
     main()